@@ -41,6 +41,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         enable_host_telemetry=enable_host,
     )
 
+    # Keep cached device / disabled-entity counts in sync with the registries
+    entry.async_on_unload(coordinator.async_track_registries())
+
     # Perform an initial data refresh so entities have data on first load
     await coordinator.async_config_entry_first_refresh()
 
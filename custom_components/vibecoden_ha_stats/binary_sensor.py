@@ -11,12 +11,12 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import VibeStatsCoordinator
+from .coordinator import EMPTY_SECTION, VibeStatsCoordinator, device_info_for
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,13 +47,15 @@ async def async_setup_entry(
 ) -> None:
     """Set up binary sensor entities from a config entry."""
     coordinator: VibeStatsCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if not coordinator.enable_fun_stats:
+        return
 
-    entities: list[VibeBinarySensor] = []
-    if coordinator.enable_fun_stats:
-        for description in BINARY_SENSORS:
-            entities.append(VibeBinarySensor(coordinator, entry, description))
+    device_info = device_info_for(entry.entry_id)
 
-    async_add_entities(entities)
+    async_add_entities(
+        VibeBinarySensor(coordinator, entry, description, device_info)
+        for description in BINARY_SENSORS
+    )
 
 
 class VibeBinarySensor(CoordinatorEntity[VibeStatsCoordinator], BinarySensorEntity):
@@ -67,30 +69,28 @@ class VibeBinarySensor(CoordinatorEntity[VibeStatsCoordinator], BinarySensorEnti
         coordinator: VibeStatsCoordinator,
         entry: ConfigEntry,
         description: VibeBinarySensorDescription,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialise."""
         super().__init__(coordinator)
         self.entity_description = description
         self._entry = entry
+        self._section = description.data_section
+        self._key = description.data_key
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="Vibecoden HA Stats",
-            manufacturer="Vibecoden",
-            model="HA Stats",
-            entry_type=DeviceEntryType.SERVICE,
-        )
+        self._attr_device_info = device_info
 
     @property
     def is_on(self) -> bool | None:
         """Return True when the condition is active."""
-        section = self.entity_description.data_section
-        key = self.entity_description.data_key
-        data: dict[str, Any] = self.coordinator.data or {}
-        value = data.get(section, {}).get(key)
-        _LOGGER.debug(
-            "Binary sensor %s value: %s", self.entity_description.key, value
-        )
+        data: dict[str, Any] | None = self.coordinator.data
+        if not data:
+            return None
+        value = data.get(self._section, EMPTY_SECTION).get(self._key)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Binary sensor %s value: %s", self.entity_description.key, value
+            )
         if value is None:
             return None
         return bool(value)
@@ -18,6 +18,17 @@ from .const import (
     DOMAIN,
 )
 
+# (option key, default, validator) — only the defaults vary per render
+_OPTIONS: tuple[tuple[str, Any, Any], ...] = (
+    (
+        CONF_SCAN_INTERVAL,
+        DEFAULT_SCAN_INTERVAL,
+        vol.All(vol.Coerce(int), vol.Range(min=30, max=86400)),
+    ),
+    (CONF_ENABLE_FUN_STATS, DEFAULT_ENABLE_FUN_STATS, bool),
+    (CONF_ENABLE_HOST_TELEMETRY, DEFAULT_ENABLE_HOST_TELEMETRY, bool),
+)
+
 
 class VibeStatsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle the initial config flow (one-shot setup — no user input needed)."""
@@ -64,20 +75,8 @@ class VibeStatsOptionsFlow(config_entries.OptionsFlow):
 
         schema = vol.Schema(
             {
-                vol.Optional(
-                    CONF_SCAN_INTERVAL,
-                    default=current.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-                ): vol.All(vol.Coerce(int), vol.Range(min=30, max=86400)),
-                vol.Optional(
-                    CONF_ENABLE_FUN_STATS,
-                    default=current.get(CONF_ENABLE_FUN_STATS, DEFAULT_ENABLE_FUN_STATS),
-                ): bool,
-                vol.Optional(
-                    CONF_ENABLE_HOST_TELEMETRY,
-                    default=current.get(
-                        CONF_ENABLE_HOST_TELEMETRY, DEFAULT_ENABLE_HOST_TELEMETRY
-                    ),
-                ): bool,
+                vol.Optional(key, default=current.get(key, default)): validator
+                for key, default, validator in _OPTIONS
             }
         )
 
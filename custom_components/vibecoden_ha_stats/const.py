@@ -47,6 +47,9 @@ POKEMON_NAMES: list[str] = [
     "mewtwo", "mew",
 ]
 
+# Hash lookup table for whole-word Pokémon matching
+POKEMON_SET: frozenset[str] = frozenset(POKEMON_NAMES)
+
 # Daily rotating device quotes
 DEVICE_QUOTES: list[str] = [
     "I'm not lazy, I'm in power-saving mode. 🔋",
@@ -1,40 +1,161 @@
 """Vibecoden HA Stats — DataUpdateCoordinator."""
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
+import math
 import re
+from collections import Counter
+from collections.abc import Awaitable
+from functools import lru_cache
 from typing import Any
 
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
-    POKEMON_NAMES,
+    POKEMON_SET,
     DEVICE_QUOTES,
     HOUSE_MASCOTS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-# Common emoji pattern (BMP + supplementary planes)
+# psutil is optional — without it uptime is 0 and host telemetry is None
+try:
+    import psutil  # type: ignore[import]
+except ImportError:
+    psutil = None
+
+# Common emoji code point ranges (BMP + supplementary planes), inclusive
+_EMOJI_RANGES: tuple[tuple[int, int], ...] = (
+    (0x1F600, 0x1F64F),
+    (0x1F300, 0x1F5FF),
+    (0x1F680, 0x1F6FF),
+    (0x1F700, 0x1F77F),
+    (0x1F780, 0x1F7FF),
+    (0x1F800, 0x1F8FF),
+    (0x1F900, 0x1F9FF),
+    (0x1FA00, 0x1FA6F),
+    (0x1FA70, 0x1FAFF),
+    (0x2600, 0x26FF),
+    (0x2700, 0x27BF),
+)
+
+# Every emoji character as a set, for cheap "any emoji at all?" checks
+_EMOJI_CHARS: frozenset[str] = frozenset(
+    chr(cp) for lo, hi in _EMOJI_RANGES for cp in range(lo, hi + 1)
+)
+
 _EMOJI_RE = re.compile(
-    "[\U0001F600-\U0001F64F"
-    "\U0001F300-\U0001F5FF"
-    "\U0001F680-\U0001F6FF"
-    "\U0001F700-\U0001F77F"
-    "\U0001F780-\U0001F7FF"
-    "\U0001F800-\U0001F8FF"
-    "\U0001F900-\U0001F9FF"
-    "\U0001FA00-\U0001FA6F"
-    "\U0001FA70-\U0001FAFF"
-    "\u2600-\u26FF"
-    "\u2700-\u27BF"
-    "]+",
+    "["
+    + "".join(f"{chr(lo)}-{chr(hi)}" for lo, hi in _EMOJI_RANGES)
+    + "]+",
     flags=re.UNICODE,
 )
 
+# Domains that get a dedicated sensor, mapped to their coordinator data key
+_DOMAIN_COUNT_KEYS: dict[str, str] = {
+    domain: f"{domain}_count"
+    for domain in (
+        "automation",
+        "script",
+        "scene",
+        "light",
+        "switch",
+        "binary_sensor",
+        "sensor",
+        "person",
+        "camera",
+        "media_player",
+        "cover",
+        "climate",
+    )
+}
+
+# Energy units we aggregate, mapped to their factor to kWh
+_ENERGY_UNIT_SCALE: dict[str, float] = {"kwh": 1.0, "wh": 0.001}
+
+# Energy sensor states that carry no numeric reading
+_BAD_STATES: frozenset[str | None] = frozenset(("unavailable", "unknown", "", None))
+
+# Any ASCII digit, for the "names with numbers" stat.  Non-ASCII names
+# fall back to str.isdigit(), which also counts e.g. "²" and "①".
+_HAS_DIGIT_RE = re.compile(r"\d")
+
+# Splits friendly names into words for Pokémon lookup
+_WORD_SPLIT_RE = re.compile(r"[\W_]+")
+
+# Newer HA cores cache last_changed as a float timestamp on State
+_HAS_LAST_CHANGED_TS: bool = hasattr(State, "last_changed_timestamp")
+
+
+def _read_psutil() -> tuple[Any, float, float]:
+    """Read CPU times / RAM / disk usage (blocking — run in the executor).
+
+    CPU is returned as the raw system-wide ``cpu_times()`` counters; the
+    coordinator turns two consecutive samples into a usage percentage.
+    """
+    cpu_times = psutil.cpu_times()
+    ram = psutil.virtual_memory().percent
+    disk = psutil.disk_usage("/").percent
+    return cpu_times, ram, disk
+
+
+def _cpu_busy_total(cpu_times: Any) -> tuple[float, float]:
+    """Return (busy, total) seconds from a psutil ``cpu_times()`` sample."""
+    total = sum(cpu_times)
+    # On Linux guest time is already included in user / nice
+    total -= getattr(cpu_times, "guest", 0.0) + getattr(cpu_times, "guest_nice", 0.0)
+    idle = cpu_times.idle + getattr(cpu_times, "iowait", 0.0)
+    return total - idle, total
+
+
+def _cpu_percent(prev: Any | None, cur: Any) -> float | None:
+    """Return CPU usage in % between two ``cpu_times()`` samples.
+
+    Without a previous sample the average since boot is returned.
+    """
+    busy, total = _cpu_busy_total(cur)
+    if prev is not None:
+        prev_busy, prev_total = _cpu_busy_total(prev)
+        busy -= prev_busy
+        total -= prev_total
+    if total <= 0:
+        return None
+    return round(min(max(busy / total * 100, 0.0), 100.0), 1)
+
+
+@lru_cache(maxsize=2)
+def _daily_pick(day: datetime.date) -> tuple[str, str]:
+    """Return the (quote, mascot) pair for the given day."""
+    day_of_year = day.timetuple().tm_yday
+    return (
+        DEVICE_QUOTES[day_of_year % len(DEVICE_QUOTES)],
+        HOUSE_MASCOTS[day_of_year % len(HOUSE_MASCOTS)],
+    )
+
+
+# Shared fallback for a missing data section in the platforms (never mutated)
+EMPTY_SECTION: dict[str, Any] = {}
+
+
+@lru_cache(maxsize=None)
+def device_info_for(entry_id: str) -> dr.DeviceInfo:
+    """Return the service device all entities of a config entry belong to."""
+    return dr.DeviceInfo(
+        identifiers={(DOMAIN, entry_id)},
+        name="Vibecoden HA Stats",
+        manufacturer="Vibecoden",
+        model="HA Stats",
+        entry_type=dr.DeviceEntryType.SERVICE,
+    )
+
 
 class VibeStatsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Central coordinator that gathers all HA stats."""
@@ -52,9 +173,59 @@ class VibeStatsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=DOMAIN,
             update_interval=update_interval,
+            # Stats rarely change between refreshes; skip entity writes
+            # when the new payload compares equal to the previous one.
+            always_update=False,
         )
         self.enable_fun_stats = enable_fun_stats
         self.enable_host_telemetry = enable_host_telemetry
+        # cpu_times() sample of the previous refresh; CPU usage is the
+        # busy share of the delta, i.e. over the last refresh interval.
+        self._cpu_times: Any | None = None
+        # (state count, newest last_updated) of the states the last fun
+        # stats were computed from, and those stats.
+        self._fun_signature: tuple[int, datetime.datetime | None] | None = None
+        self._last_fun: dict[str, Any] | None = None
+        # Registry-derived counts; reset to None by registry update events
+        # and recounted on the next refresh.
+        self._total_devices: int | None = None
+        self._disabled_entities: int | None = None
+
+    # ------------------------------------------------------------------
+    # Registry change tracking
+    # ------------------------------------------------------------------
+
+    @callback
+    def async_track_registries(self) -> CALLBACK_TYPE:
+        """Invalidate cached registry counts when a registry changes.
+
+        Returns a callback that removes the listeners.
+        """
+        unsubs = [
+            self.hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated
+            ),
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+            ),
+        ]
+
+        @callback
+        def _async_unsub() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return _async_unsub
+
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        """Recount devices on the next refresh."""
+        self._total_devices = None
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        """Recount disabled entities on the next refresh."""
+        self._disabled_entities = None
 
     # ------------------------------------------------------------------
     # Main data-fetch method
@@ -63,23 +234,48 @@ class VibeStatsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch fresh stats from Home Assistant internals."""
         try:
-            core = await self._collect_core_stats()
-            fun: dict[str, Any] = {}
-            if self.enable_fun_stats:
-                # Capture states on the event loop before handing off to a thread.
-                # hass.states.async_all() is NOT thread-safe and must only be
-                # called from the event loop.
-                all_states = self.hass.states.async_all()
-                everything_off = not any(
-                    s.state == "on"
-                    for s in all_states
-                    if s.entity_id.startswith("light.")
-                )
+            # Snapshot states once on the event loop and share it between
+            # collectors.  hass.states.async_all() is NOT thread-safe and
+            # must only be called from the event loop; the returned State
+            # objects are immutable and safe to read from a worker thread.
+            all_states = self.hass.states.async_all()
+            core, signature = self._collect_core_stats(all_states)
+            # Lights were already counted in the core single pass.
+            everything_off = core["lights_on"] == 0
+            # Fun stats only depend on entity IDs and friendly names; when
+            # no state was added, removed or updated they cannot change.
+            rescan_fun = self.enable_fun_stats and (
+                self._last_fun is None or signature != self._fun_signature
+            )
+
+            # The psutil read and the fun-stats scan both run in the
+            # executor — start them together so neither waits on the other.
+            jobs: list[Awaitable[Any]] = [self._async_collect_host_telemetry()]
+            if rescan_fun:
                 # CPU-light string operations — run in executor to avoid
                 # blocking the event loop.
-                fun = await self.hass.async_add_executor_job(
-                    self._collect_fun_stats_sync, all_states, everything_off
+                jobs.append(
+                    self.hass.async_add_executor_job(
+                        self._collect_fun_stats_sync,
+                        all_states,
+                        everything_off,
+                    )
                 )
+            host, *rest = await asyncio.gather(*jobs)
+            core.update(host)
+            fun: dict[str, Any] = {}
+            if rescan_fun:
+                fun = self._last_fun = rest[0]
+                self._fun_signature = signature
+            elif self.enable_fun_stats and self._last_fun is not None:
+                # Daily picks roll over at midnight even on an idle system
+                quote, mascot = _daily_pick(datetime.date.today())
+                fun = {
+                    **self._last_fun,
+                    "random_daily_quote": quote,
+                    "house_mascot": mascot,
+                    "everything_off": everything_off,
+                }
             return {"core": core, "fun": fun}
         except Exception as err:
             raise UpdateFailed(f"Error updating VibeStats data: {err}") from err
@@ -88,60 +284,95 @@ class VibeStatsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     # Core stats
     # ------------------------------------------------------------------
 
-    async def _collect_core_stats(self) -> dict[str, Any]:
-        """Collect useful / actionable statistics."""
+    def _collect_core_stats(
+        self, all_states: list[State]
+    ) -> tuple[dict[str, Any], tuple[int, datetime.datetime | None]]:
+        """Collect useful / actionable statistics.
+
+        ``all_states`` is the snapshot taken in ``_async_update_data``.
+        Also returns a cheap signature of the snapshot — the state count
+        and the newest ``last_updated`` — used to skip unchanged fun stats.
+        Host telemetry is gathered separately by
+        ``_async_collect_host_telemetry``.
+        """
         hass = self.hass
 
         # ── Entity & device counts ──────────────────────────────────
-        all_states = hass.states.async_all()
         total_entities: int = len(all_states)
 
-        total_devices: int = 0
-        try:
-            from homeassistant.helpers import device_registry as dr
-            dev_reg = dr.async_get(hass)
-            total_devices = len(dev_reg.devices)
-        except Exception:
-            _LOGGER.debug("Could not access device registry", exc_info=True)
+        # Registry counts are cached until a registry update event
+        if self._total_devices is None:
+            try:
+                dev_reg = dr.async_get(hass)
+                self._total_devices = len(dev_reg.devices)
+            except Exception:
+                _LOGGER.debug("Could not access device registry", exc_info=True)
+        total_devices: int = self._total_devices or 0
 
         # ── Entity registry stats ────────────────────────────────────
-        disabled_entities: int = 0
-        try:
-            from homeassistant.helpers import entity_registry as er
-            ent_reg = er.async_get(hass)
-            disabled_entities = sum(
-                1 for e in ent_reg.entities.values() if e.disabled
-            )
-        except Exception:
-            _LOGGER.debug("Could not access entity registry", exc_info=True)
+        if self._disabled_entities is None:
+            try:
+                ent_reg = er.async_get(hass)
+                self._disabled_entities = sum(
+                    1 for e in ent_reg.entities.values() if e.disabled
+                )
+            except Exception:
+                _LOGGER.debug("Could not access entity registry", exc_info=True)
+        disabled_entities: int = self._disabled_entities or 0
 
         # ── Integration count ────────────────────────────────────────
         integrations_count: int = len(hass.config_entries.async_entries())
 
-        # ── Domain-specific counts ───────────────────────────────────
-        domain_counts: dict[str, int] = {}
+        # ── Single pass over all states ──────────────────────────────
+        # Domain counts, state health, 24 h activity, lights and energy
+        # are all accumulated in one traversal of the state list.
+        now = dt_util.utcnow()
+        cutoff = now - datetime.timedelta(hours=24)
+        # Compare float timestamps where the core provides them
+        cutoff_key: float | datetime.datetime = (
+            cutoff.timestamp() if _HAS_LAST_CHANGED_TS else cutoff
+        )
+
+        domain_counts: Counter[str] = Counter()
         unavailable_count: int = 0
         unknown_count: int = 0
+        active_entities_24h: int = 0
+        lights_on: int = 0
+        # Note: we sum the *current* state values of all energy (kWh/Wh)
+        # sensors as a proxy for 24h consumption. Only the ``sensor``
+        # domain is considered, so other states never touch attributes.
+        # For accurate historical totals, HA's Statistics subsystem would
+        # need to be queried.
+        energy_parts: list[float] = []
+        newest_update: datetime.datetime | None = None
         for s in all_states:
-            domain = s.entity_id.split(".")[0]
-            domain_counts[domain] = domain_counts.get(domain, 0) + 1
-            if s.state == "unavailable":
+            last_updated = s.last_updated
+            if newest_update is None or last_updated > newest_update:
+                newest_update = last_updated
+            state = s.state
+            domain = s.entity_id.partition(".")[0]
+            domain_counts[domain] += 1
+            if state == "unavailable":
                 unavailable_count += 1
-            elif s.state == "unknown":
+            elif state == "unknown":
                 unknown_count += 1
+            elif state == "on" and domain == "light":
+                lights_on += 1
+            last_changed = (
+                s.last_changed_timestamp if _HAS_LAST_CHANGED_TS else s.last_changed
+            )
+            if last_changed is not None and last_changed >= cutoff_key:
+                active_entities_24h += 1
+            if domain != "sensor":
+                continue
+            kwh = self._energy_kwh(
+                state, s.attributes.get("unit_of_measurement") or ""
+            )
+            if kwh is not None:
+                energy_parts.append(kwh)
+        energy_24h_kwh: float = round(math.fsum(energy_parts), 3)
+        energy_entity_count: int = len(energy_parts)
 
-        automation_count: int = domain_counts.get("automation", 0)
-        script_count: int = domain_counts.get("script", 0)
-        scene_count: int = domain_counts.get("scene", 0)
-        light_count: int = domain_counts.get("light", 0)
-        switch_count: int = domain_counts.get("switch", 0)
-        binary_sensor_count: int = domain_counts.get("binary_sensor", 0)
-        sensor_count: int = domain_counts.get("sensor", 0)
-        person_count: int = domain_counts.get("person", 0)
-        camera_count: int = domain_counts.get("camera", 0)
-        media_player_count: int = domain_counts.get("media_player", 0)
-        cover_count: int = domain_counts.get("cover", 0)
-        climate_count: int = domain_counts.get("climate", 0)
         unique_domains_count: int = len(domain_counts)
 
         # ── Uptime ────────────────────────────────────────────────────
@@ -149,118 +380,76 @@ class VibeStatsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # We fall back to 0 if psutil is unavailable.
         uptime_days: int = 0
         uptime_hours: float = 0.0
-        try:
-            import homeassistant.util.dt as dt_util
-            boot_time: datetime.datetime | None = None
-
+        if psutil is None:
+            _LOGGER.debug("psutil not available — uptime will be 0")
+        else:
             try:
-                import psutil  # type: ignore[import]
-                boot_ts = psutil.boot_time()
                 boot_time = datetime.datetime.fromtimestamp(
-                    boot_ts, tz=datetime.timezone.utc
+                    psutil.boot_time(), tz=datetime.timezone.utc
                 )
                 _LOGGER.debug("Boot time from psutil: %s", boot_time)
-            except ImportError:
-                _LOGGER.debug("psutil not available — uptime will be 0")
-
-            if boot_time is not None:
-                delta = dt_util.utcnow() - boot_time
+                delta = now - boot_time
                 uptime_days = max(0, delta.days)
                 uptime_hours = round(max(0.0, delta.total_seconds() / 3600), 1)
-        except Exception:
-            _LOGGER.debug("Could not calculate uptime", exc_info=True)
+            except Exception:
+                _LOGGER.debug("Could not calculate uptime", exc_info=True)
 
-        # ── Active entities in last 24h ───────────────────────────────
-        active_entities_24h: int = 0
-        try:
-            import homeassistant.util.dt as dt_util
-            cutoff = dt_util.utcnow() - datetime.timedelta(hours=24)
-            active_entities_24h = sum(
-                1
-                for s in all_states
-                if s.last_changed is not None and s.last_changed >= cutoff
-            )
-        except Exception:
-            _LOGGER.debug("Could not calculate active entities", exc_info=True)
+        core: dict[str, Any] = {
+            "total_entities": total_entities,
+            "total_devices": total_devices,
+            "disabled_entities": disabled_entities,
+            "integrations_count": integrations_count,
+            "unique_domains_count": unique_domains_count,
+            "domain_counts": dict(domain_counts),
+            "unavailable_count": unavailable_count,
+            "unknown_count": unknown_count,
+            **{
+                key: domain_counts[domain]
+                for domain, key in _DOMAIN_COUNT_KEYS.items()
+            },
+            "lights_on": lights_on,
+            "uptime_days": uptime_days,
+            "uptime_hours": uptime_hours,
+            "active_entities_24h": active_entities_24h,
+            "energy_24h_kwh": energy_24h_kwh,
+            "energy_entity_count": energy_entity_count,
+        }
+        return core, (total_entities, newest_update)
+
+    # ------------------------------------------------------------------
+    # Host telemetry
+    # ------------------------------------------------------------------
 
-        # ── Host telemetry (CPU / RAM) ────────────────────────────────
+    async def _async_collect_host_telemetry(self) -> dict[str, float | None]:
+        """Read host CPU / RAM / disk usage via psutil (if enabled)."""
         host_cpu_pct: float | None = None
         host_ram_pct: float | None = None
         host_disk_pct: float | None = None
 
-        if self.enable_host_telemetry:
+        if self.enable_host_telemetry and psutil is None:
+            _LOGGER.debug(
+                "psutil not installed — host telemetry unavailable. "
+                "Install psutil or disable host telemetry in options."
+            )
+        elif self.enable_host_telemetry:
             try:
-                import psutil  # type: ignore[import]
-
                 # psutil calls are blocking — push to thread pool
-                def _read_psutil() -> tuple[float, float, float]:
-                    cpu = psutil.cpu_percent(interval=0.5)
-                    ram = psutil.virtual_memory().percent
-                    disk = psutil.disk_usage("/").percent
-                    return cpu, ram, disk
-
-                host_cpu_pct, host_ram_pct, host_disk_pct = (
+                cpu_times, host_ram_pct, host_disk_pct = (
                     await self.hass.async_add_executor_job(_read_psutil)
                 )
+                host_cpu_pct = _cpu_percent(self._cpu_times, cpu_times)
+                self._cpu_times = cpu_times
                 _LOGGER.debug(
-                    "CPU: %.1f%% / RAM: %.1f%% / Disk: %.1f%%",
+                    "CPU: %s%% / RAM: %.1f%% / Disk: %.1f%%",
                     host_cpu_pct, host_ram_pct, host_disk_pct,
                 )
-            except ImportError:
-                _LOGGER.debug(
-                    "psutil not installed — host telemetry unavailable. "
-                    "Install psutil or disable host telemetry in options."
-                )
             except Exception:
                 _LOGGER.debug("Error reading host telemetry", exc_info=True)
 
-        # ── Energy sensors (current state sum) ────────────────────────
-        # Note: we sum the *current* state values of all energy (kWh/Wh)
-        # sensors as a proxy for 24h consumption. For accurate historical
-        # totals, HA's Statistics subsystem would need to be queried.
-        energy_24h_kwh: float = 0.0
-        energy_entity_count: int = 0
-        try:
-            energy_24h_kwh, energy_entity_count = self._aggregate_energy(all_states)
-        except Exception:
-            _LOGGER.debug("Could not aggregate energy stats", exc_info=True)
-
-        # ── Lights currently on ───────────────────────────────────────
-        lights_on: int = sum(
-            1 for s in all_states
-            if s.entity_id.startswith("light.") and s.state == "on"
-        )
-
         return {
-            "total_entities": total_entities,
-            "total_devices": total_devices,
-            "disabled_entities": disabled_entities,
-            "integrations_count": integrations_count,
-            "unique_domains_count": unique_domains_count,
-            "domain_counts": domain_counts,
-            "unavailable_count": unavailable_count,
-            "unknown_count": unknown_count,
-            "automation_count": automation_count,
-            "script_count": script_count,
-            "scene_count": scene_count,
-            "light_count": light_count,
-            "switch_count": switch_count,
-            "binary_sensor_count": binary_sensor_count,
-            "sensor_count": sensor_count,
-            "person_count": person_count,
-            "camera_count": camera_count,
-            "media_player_count": media_player_count,
-            "cover_count": cover_count,
-            "climate_count": climate_count,
-            "lights_on": lights_on,
-            "uptime_days": uptime_days,
-            "uptime_hours": uptime_hours,
-            "active_entities_24h": active_entities_24h,
             "host_cpu_pct": host_cpu_pct,
             "host_ram_pct": host_ram_pct,
             "host_disk_pct": host_disk_pct,
-            "energy_24h_kwh": energy_24h_kwh,
-            "energy_entity_count": energy_entity_count,
         }
 
     # ------------------------------------------------------------------
@@ -285,73 +474,80 @@ class VibeStatsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         everything_off:
             Pre-computed flag: True when no light entity is ``on``.
         """
-        entity_ids: list[str] = [s.entity_id for s in all_states]
+        # One pass over the states: entity-ID length stats + friendly names
         all_names: list[str] = []
+        total_id_len: int = 0
+        longest_entity_id: str = ""
+        shortest_entity_id: str = ""
+        longest_len: int = -1
+        shortest_len: int = -1
         for s in all_states:
+            eid = s.entity_id
+            eid_len = len(eid)
+            total_id_len += eid_len
+            if eid_len > longest_len:
+                longest_len, longest_entity_id = eid_len, eid
+            if shortest_len < 0 or eid_len < shortest_len:
+                shortest_len, shortest_entity_id = eid_len, eid
             name = s.attributes.get("friendly_name") or ""
             if name:
                 all_names.append(name)
 
         # ── Average entity-ID length ─────────────────────────────────
         avg_entity_id_length: float = (
-            sum(len(eid) for eid in entity_ids) / len(entity_ids)
-            if entity_ids
-            else 0.0
+            total_id_len / len(all_states) if all_states else 0.0
         )
 
-        # ── Longest / shortest entity ID ─────────────────────────────
-        longest_entity_id: str = max(entity_ids, key=len) if entity_ids else ""
-        shortest_entity_id: str = min(entity_ids, key=len) if entity_ids else ""
-
         # ── Most used emoji across friendly names ─────────────────────
-        emoji_counts: dict[str, int] = {}
-        total_chars: int = 0
-        emoji_chars: int = 0
-        for name in all_names:
-            total_chars += len(name)
-            for match in _EMOJI_RE.finditer(name):
-                emoji_chars += len(match.group())
-                for ch in match.group():
-                    emoji_counts[ch] = emoji_counts.get(ch, 0) + 1
+        # One regex scan over all names, then a C-level tally of the hits.
+        all_text: str = "".join(all_names)
+        total_chars: int = len(all_text)
+        # isascii() is O(1) on CPython and settles the common all-ASCII
+        # case; otherwise the set check still avoids a pointless regex scan.
+        emoji_blob: str = (
+            ""
+            if all_text.isascii() or _EMOJI_CHARS.isdisjoint(all_text)
+            else "".join(_EMOJI_RE.findall(all_text))
+        )
+        emoji_chars: int = len(emoji_blob)
+        emoji_counts: Counter[str] = Counter(emoji_blob)
 
         most_used_emoji: str = (
-            max(emoji_counts, key=lambda e: emoji_counts[e])
-            if emoji_counts
-            else "🤷"
+            emoji_counts.most_common(1)[0][0] if emoji_counts else "🤷"
         )
         emoji_density: float = (
             round(emoji_chars / total_chars * 100, 2) if total_chars > 0 else 0.0
         )
 
-        # ── Devices named after Pokémon ───────────────────────────────
-        pokemon_count: int = sum(
-            1
-            for name in all_names
-            if any(pokemon in name.lower() for pokemon in POKEMON_NAMES)
-        )
-
-        # ── Most redundant name (most duplicated friendly name) ───────
-        name_freq: dict[str, int] = {}
+        # ── Per-name stats: Pokémon, digits, duplicates ──────────────
+        # One pass over the names; each is lower-cased once.
+        pokemon_count: int = 0
+        names_with_numbers: int = 0
+        name_freq: Counter[str] = Counter()
         for name in all_names:
-            clean = name.strip().lower()
+            lower = name.lower()
+            if not POKEMON_SET.isdisjoint(_WORD_SPLIT_RE.split(lower)):
+                pokemon_count += 1
+            if (
+                _HAS_DIGIT_RE.search(name)
+                if name.isascii()
+                else any(ch.isdigit() for ch in name)
+            ):
+                names_with_numbers += 1
+            # strip() after lower() gives the same key as strip().lower()
+            clean = lower.strip()
             if clean:
-                name_freq[clean] = name_freq.get(clean, 0) + 1
+                name_freq[clean] += 1
 
+        # ── Most redundant name (most duplicated friendly name) ───────
         most_redundant_name: str = "N/A"
         if name_freq:
-            best = max(name_freq, key=lambda n: (name_freq[n], -len(n)))
-            if name_freq[best] > 1:
-                most_redundant_name = f"{best!r} (×{name_freq[best]})"
-
-        # ── Names that contain numbers ────────────────────────────────
-        names_with_numbers: int = sum(
-            1 for name in all_names if any(ch.isdigit() for ch in name)
-        )
+            best, count = max(name_freq.items(), key=lambda kv: (kv[1], -len(kv[0])))
+            if count > 1:
+                most_redundant_name = f"{best!r} (×{count})"
 
         # ── Daily rotating quotes / mascots ──────────────────────────
-        day_of_year: int = datetime.date.today().timetuple().tm_yday
-        random_daily_quote: str = DEVICE_QUOTES[day_of_year % len(DEVICE_QUOTES)]
-        house_mascot: str = HOUSE_MASCOTS[day_of_year % len(HOUSE_MASCOTS)]
+        random_daily_quote, house_mascot = _daily_pick(datetime.date.today())
 
         return {
             "most_used_emoji": most_used_emoji,
@@ -373,27 +569,18 @@ class VibeStatsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _aggregate_energy(all_states: list[Any]) -> tuple[float, int]:
-        """Sum the state values of all energy sensors (kWh).
+    def _energy_kwh(state: str, unit: Any) -> float | None:
+        """Convert an energy sensor state to kWh.
 
-        Returns a tuple of (total_kwh, number_of_contributing_entities).
+        Returns None when the unit is not kWh/Wh or the state is not numeric.
         """
-        total: float = 0.0
-        count: int = 0
-        for state in all_states:
-            unit = state.attributes.get("unit_of_measurement", "")
-            if unit.lower() in ("kwh", "wh") and state.state not in (
-                "unavailable",
-                "unknown",
-                "",
-                None,
-            ):
-                try:
-                    value = float(state.state)
-                    if unit.lower() == "wh":
-                        value /= 1000.0
-                    total += value
-                    count += 1
-                except ValueError:
-                    pass
-        return round(total, 3), count
+        # Attributes are free-form; a misbehaving entity must not fail the refresh
+        if not isinstance(unit, str):
+            return None
+        scale = _ENERGY_UNIT_SCALE.get(unit.lower())
+        if scale is None or state in _BAD_STATES:
+            return None
+        try:
+            return float(state) * scale
+        except ValueError:
+            return None
@@ -14,12 +14,12 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfEnergy, UnitOfTime
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import VibeStatsCoordinator
+from .coordinator import EMPTY_SECTION, VibeStatsCoordinator, device_info_for
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -346,17 +346,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensor entities from a config entry."""
     coordinator: VibeStatsCoordinator = hass.data[DOMAIN][entry.entry_id]
+    device_info = device_info_for(entry.entry_id)
 
-    entities: list[VibeSensor] = []
-
-    for description in CORE_SENSORS:
-        entities.append(VibeSensor(coordinator, entry, description))
-
+    descriptions = CORE_SENSORS
     if coordinator.enable_fun_stats:
-        for description in FUN_SENSORS:
-            entities.append(VibeSensor(coordinator, entry, description))
+        descriptions += FUN_SENSORS
 
-    async_add_entities(entities)
+    async_add_entities(
+        VibeSensor(coordinator, entry, description, device_info)
+        for description in descriptions
+    )
 
 
 class VibeSensor(CoordinatorEntity[VibeStatsCoordinator], SensorEntity):
@@ -370,39 +369,37 @@ class VibeSensor(CoordinatorEntity[VibeStatsCoordinator], SensorEntity):
         coordinator: VibeStatsCoordinator,
         entry: ConfigEntry,
         description: VibeSensorDescription,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialise."""
         super().__init__(coordinator)
         self.entity_description = description
         self._entry = entry
+        self._section = description.data_section
+        self._key = description.data_key
+        self._extra_attrs = description.extra_attrs
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="Vibecoden HA Stats",
-            manufacturer="Vibecoden",
-            model="HA Stats",
-            entry_type=DeviceEntryType.SERVICE,
-        )
+        self._attr_device_info = device_info
 
     @property
     def native_value(self) -> Any:
         """Return the current sensor value."""
-        section = self.entity_description.data_section
-        key = self.entity_description.data_key
-        data: dict[str, Any] = self.coordinator.data or {}
-        value = data.get(section, {}).get(key)
-        _LOGGER.debug("Sensor %s value: %s", self.entity_description.key, value)
+        data: dict[str, Any] | None = self.coordinator.data
+        if not data:
+            return None
+        value = data.get(self._section, EMPTY_SECTION).get(self._key)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sensor %s value: %s", self.entity_description.key, value)
         return value
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes if defined in the description."""
-        extra_attrs = self.entity_description.extra_attrs
+        extra_attrs = self._extra_attrs
         if not extra_attrs:
             return None
-        section = self.entity_description.data_section
-        data: dict[str, Any] = self.coordinator.data or {}
-        section_data = data.get(section, {})
+        data: dict[str, Any] = self.coordinator.data or EMPTY_SECTION
+        section_data = data.get(self._section, EMPTY_SECTION)
         return {
             attr_name: section_data.get(data_key)
             for attr_name, data_key in extra_attrs.items()
@@ -6,10 +6,20 @@ dashboard that fetches live state from the Home Assistant REST API.
 from __future__ import annotations
 
 import os
+import threading
+import time
 from typing import Any
 
 import requests
 from flask import Flask, jsonify, render_template
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Faster JSON when a wheel exists for the add-on arch; stdlib otherwise
+try:
+    import orjson  # type: ignore[import]
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 
@@ -18,6 +28,12 @@ HA_URL: str = os.environ.get("HA_URL", "http://supervisor/core").rstrip("/")
 HA_TOKEN: str = os.environ.get("HA_TOKEN", "")
 REFRESH_INTERVAL: int = int(os.environ.get("REFRESH_INTERVAL", "30"))
 
+# Dashboard polls arriving within this many seconds share one HA fetch
+STATES_CACHE_TTL: int = max(5, REFRESH_INTERVAL // 2)
+# After a failed fetch, polls get an empty result for this many seconds
+# instead of each waiting out another upstream timeout
+STATES_FAILURE_BACKOFF: int = 5
+
 # ── Entities shown on the dashboard ──────────────────────────────────────────
 # Each entry: (entity_id, friendly_label, icon_class, section)
 ENTITIES: list[tuple[str, str, str, str]] = [
@@ -54,6 +70,15 @@ ENTITIES: list[tuple[str, str, str, str]] = [
     ("binary_sensor.everything_off_party_mode", "Party Mode 🎉",     "mdi:party-popper",       "fun"),
 ]
 
+# Static per-entity metadata, merged with live state in api_stats
+_ENTITY_META: dict[str, dict[str, str]] = {
+    entity_id: {"label": label, "icon": icon, "section": section}
+    for entity_id, label, icon, section in ENTITIES
+}
+
+# Entity IDs the dashboard shows; everything else in /api/states is dropped
+_ENTITY_IDS: frozenset[str] = frozenset(_ENTITY_META)
+
 
 def _ha_headers() -> dict[str, str]:
     return {
@@ -62,20 +87,59 @@ def _ha_headers() -> dict[str, str]:
     }
 
 
+# One keep-alive connection pool to HA, reused across polls.  Transient
+# gateway errors (e.g. while Core restarts) are retried a couple of times;
+# connect / read errors are not, so one fetch stays within its timeout.
+_session = requests.Session()
+_session.headers.update(_ha_headers())
+_adapter = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=2,
+        connect=0,
+        read=0,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+    ),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# (monotonic expiry time, states) of the last fetch outcome.  The lock
+# makes concurrent requests wait for one in-flight fetch and then reuse
+# its outcome — including a failure — instead of each hitting HA.
+_states_cache: tuple[float, dict[str, Any]] | None = None
+_states_lock = threading.Lock()
+
+
 def _fetch_states() -> dict[str, Any]:
-    """Fetch all entity states from HA REST API and return as dict keyed by entity_id."""
-    try:
-        resp = requests.get(
-            f"{HA_URL}/api/states",
-            headers=_ha_headers(),
-            timeout=10,
-        )
-        resp.raise_for_status()
-        states: list[dict[str, Any]] = resp.json()
-        return {s["entity_id"]: s for s in states}
-    except Exception as exc:  # noqa: BLE001
-        app.logger.error("Failed to fetch HA states: %s", exc)
-        return {}
+    """Fetch dashboard entity states from HA REST API as a dict keyed by entity_id.
+
+    Results are reused for STATES_CACHE_TTL seconds; a failure yields an
+    empty dict for STATES_FAILURE_BACKOFF seconds.
+    """
+    global _states_cache
+    with _states_lock:
+        if _states_cache is not None and time.monotonic() < _states_cache[0]:
+            return _states_cache[1]
+        try:
+            resp = _session.get(f"{HA_URL}/api/states", timeout=10)
+            resp.raise_for_status()
+            states: list[dict[str, Any]] = (
+                orjson.loads(resp.content) if orjson is not None else resp.json()
+            )
+            by_id = {
+                entity_id: s
+                for s in states
+                if (entity_id := s["entity_id"]) in _ENTITY_IDS
+            }
+        except Exception as exc:  # noqa: BLE001
+            app.logger.error("Failed to fetch HA states: %s", exc)
+            _states_cache = (time.monotonic() + STATES_FAILURE_BACKOFF, {})
+            return {}
+        _states_cache = (time.monotonic() + STATES_CACHE_TTL, by_id)
+        return by_id
 
 
 # ── Routes ────────────────────────────────────────────────────────────────────
@@ -95,15 +159,19 @@ def api_stats():
     """Return a JSON snapshot of all dashboard entity states."""
     all_states = _fetch_states()
     result: dict[str, Any] = {}
-    for entity_id, label, icon, section in ENTITIES:
+    for entity_id, meta in _ENTITY_META.items():
         state_obj = all_states.get(entity_id, {})
         result[entity_id] = {
-            "label": label,
-            "icon": icon,
-            "section": section,
+            **meta,
             "state": state_obj.get("state", "unavailable"),
             "attributes": state_obj.get("attributes", {}),
         }
+    if orjson is not None:
+        # Sorted like jsonify's default so card order never depends on orjson
+        return app.response_class(
+            orjson.dumps(result, option=orjson.OPT_SORT_KEYS),
+            mimetype="application/json",
+        )
     return jsonify(result)
 
 
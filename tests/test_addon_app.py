@@ -0,0 +1,123 @@
+"""Unit tests for the dashboard add-on's cached HA state fetch.
+
+The Flask app is loaded straight from ha_addon/app/app.py; the HA REST
+call is replaced by a stubbed ``_session.get`` and the clock by a fake
+``time`` module, so no network or Supervisor is needed.
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("requests")
+
+_APP_PATH = Path(__file__).resolve().parents[1] / "ha_addon" / "app" / "app.py"
+
+
+def _load_app():
+    spec = importlib.util.spec_from_file_location("vibe_dashboard_app", _APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _Response:
+    def __init__(self, body: Any, status_error: Exception | None = None) -> None:
+        self._body = body
+        self._status_error = status_error
+        self.content = json.dumps(body).encode()
+
+    def raise_for_status(self) -> None:
+        if self._status_error is not None:
+            raise self._status_error
+
+    def json(self) -> Any:
+        return self._body
+
+
+@pytest.fixture
+def addon(monkeypatch):
+    """Return (app module, clock, queued responses, call log)."""
+    module = _load_app()
+    clock = [1000.0]
+    responses: list[Any] = []
+    calls: list[str] = []
+
+    def fake_get(url, timeout):
+        calls.append(url)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(module, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    monkeypatch.setattr(module._session, "get", fake_get)
+    return module, clock, responses, calls
+
+
+_STATES = [
+    {"entity_id": "sensor.total_devices", "state": "12", "attributes": {}},
+    {"entity_id": "light.kitchen", "state": "on", "attributes": {}},
+]
+
+
+class TestFetchStates:
+    def test_keeps_only_dashboard_entities(self, addon):
+        module, _, responses, _ = addon
+        responses.append(_Response(_STATES))
+        assert list(module._fetch_states()) == ["sensor.total_devices"]
+
+    def test_reused_within_ttl(self, addon):
+        module, clock, responses, calls = addon
+        responses.append(_Response(_STATES))
+        first = module._fetch_states()
+        clock[0] += module.STATES_CACHE_TTL - 1
+        assert module._fetch_states() is first
+        assert len(calls) == 1
+
+    def test_refetched_after_ttl(self, addon):
+        module, clock, responses, calls = addon
+        responses.extend([_Response(_STATES), _Response([])])
+        module._fetch_states()
+        clock[0] += module.STATES_CACHE_TTL
+        assert module._fetch_states() == {}
+        assert len(calls) == 2
+
+    def test_failure_cached_for_backoff(self, addon):
+        module, clock, responses, calls = addon
+        responses.extend([ConnectionError("down"), _Response(_STATES)])
+        assert module._fetch_states() == {}
+        clock[0] += module.STATES_FAILURE_BACKOFF - 1
+        assert module._fetch_states() == {}
+        assert len(calls) == 1
+        clock[0] += 1
+        assert "sensor.total_devices" in module._fetch_states()
+        assert len(calls) == 2
+
+    def test_http_error_status_is_a_failure(self, addon):
+        module, _, responses, _ = addon
+        responses.append(_Response([], status_error=RuntimeError("502")))
+        assert module._fetch_states() == {}
+        assert module._states_cache[1] == {}
+
+    @pytest.mark.parametrize("body", [{"message": "oops"}, ["not a state"], [{}]])
+    def test_malformed_body_is_a_failure(self, addon, body):
+        module, clock, responses, calls = addon
+        responses.append(_Response(body))
+        assert module._fetch_states() == {}
+        clock[0] += module.STATES_FAILURE_BACKOFF - 1
+        assert module._fetch_states() == {}
+        assert len(calls) == 1
+
+    def test_api_stats_survives_malformed_body(self, addon):
+        module, _, responses, _ = addon
+        responses.append(_Response({"message": "oops"}))
+        resp = module.app.test_client().get("/api/stats")
+        assert resp.status_code == 200
+        assert resp.get_json()["sensor.total_devices"]["state"] == "unavailable"
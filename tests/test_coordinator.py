@@ -1,127 +1,175 @@
 """Unit tests for VibeStatsCoordinator pure-logic helpers.
 
-These tests exercise the static / synchronous helpers without requiring
-a real Home Assistant instance.  We test only the two static methods:
+These tests exercise the coordinator's synchronous logic without
+requiring a real Home Assistant instance.  The helpers are copied
+inline below (they only receive plain Python objects, no HA internals):
 
-  * VibeStatsCoordinator._aggregate_energy
+  * VibeStatsCoordinator._energy_kwh (via the core-stats energy sum)
   * VibeStatsCoordinator._collect_fun_stats_sync
+  * coordinator._daily_pick (daily quote / mascot)
+  * coordinator._cpu_percent (host CPU usage from cpu_times() samples)
 
-Both methods receive plain Python objects (no HA internals) so we can
-test them by directly copying/extracting their logic here.
+plus a mirror of the fun-stats reuse branch of
+VibeStatsCoordinator._async_update_data (snapshot signature, rescan vs
+cached merge).
 """
 from __future__ import annotations
 
 import datetime
+import math
 import re
+from collections import Counter, namedtuple
+from functools import lru_cache
 from types import SimpleNamespace
 from typing import Any
 
 import pytest
 
 # ---------------------------------------------------------------------------
-# Re-implement the two static helpers inline so we have zero HA dependencies
+# Re-implement the helpers inline so we have zero HA dependencies
 # ---------------------------------------------------------------------------
 
 POKEMON_NAMES = ["pikachu", "eevee", "mewtwo", "bulbasaur", "charmander"]
 DEVICE_QUOTES = ["Quote A", "Quote B", "Quote C"]
 HOUSE_MASCOTS = ["🦙 Llama", "🐉 Dragon", "🦊 Fox"]
 
+_EMOJI_RANGES = (
+    (0x1F600, 0x1F64F),
+    (0x1F300, 0x1F5FF),
+    (0x1F680, 0x1F6FF),
+    (0x1F900, 0x1F9FF),
+    (0x2600, 0x26FF),
+    (0x2700, 0x27BF),
+)
+_EMOJI_CHARS = frozenset(
+    chr(cp) for lo, hi in _EMOJI_RANGES for cp in range(lo, hi + 1)
+)
 _EMOJI_RE = re.compile(
-    "[\U0001F600-\U0001F64F"
-    "\U0001F300-\U0001F5FF"
-    "\U0001F680-\U0001F6FF"
-    "\U0001F900-\U0001F9FF"
-    "\u2600-\u26FF"
-    "\u2700-\u27BF"
-    "]+",
+    "[" + "".join(f"{chr(lo)}-{chr(hi)}" for lo, hi in _EMOJI_RANGES) + "]+",
     flags=re.UNICODE,
 )
+_ENERGY_UNIT_SCALE = {"kwh": 1.0, "wh": 0.001}
+_BAD_STATES = frozenset(("unavailable", "unknown", "", None))
+POKEMON_SET = frozenset(POKEMON_NAMES)
+_HAS_DIGIT_RE = re.compile(r"\d")
+_WORD_SPLIT_RE = re.compile(r"[\W_]+")
+
+_T0 = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
 
 
 def _make_state(
     entity_id: str,
     state: str = "on",
     attributes: dict[str, Any] | None = None,
+    last_updated: datetime.datetime = _T0,
 ) -> SimpleNamespace:
     return SimpleNamespace(
         entity_id=entity_id,
         state=state,
         attributes=attributes or {},
-        last_changed=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        last_changed=_T0,
+        last_updated=last_updated,
     )
 
 
+def _energy_kwh(state, unit):
+    """Direct copy of VibeStatsCoordinator._energy_kwh."""
+    # Attributes are free-form; a misbehaving entity must not fail the refresh
+    if not isinstance(unit, str):
+        return None
+    scale = _ENERGY_UNIT_SCALE.get(unit.lower())
+    if scale is None or state in _BAD_STATES:
+        return None
+    try:
+        return float(state) * scale
+    except ValueError:
+        return None
+
+
 def _aggregate_energy(all_states):
-    """Direct copy of VibeStatsCoordinator._aggregate_energy."""
-    total: float = 0.0
-    count: int = 0
+    """Mirror of the energy accumulation in VibeStatsCoordinator._collect_core_stats."""
+    parts = []
     for state in all_states:
-        unit = state.attributes.get("unit_of_measurement", "")
-        if unit.lower() in ("kwh", "wh") and state.state not in (
-            "unavailable", "unknown", "", None,
-        ):
-            try:
-                value = float(state.state)
-                if unit.lower() == "wh":
-                    value /= 1000.0
-                total += value
-                count += 1
-            except ValueError:
-                pass
-    return round(total, 3), count
+        if state.entity_id.partition(".")[0] != "sensor":
+            continue
+        kwh = _energy_kwh(
+            state.state, state.attributes.get("unit_of_measurement") or ""
+        )
+        if kwh is not None:
+            parts.append(kwh)
+    return round(math.fsum(parts), 3), len(parts)
+
+
+@lru_cache(maxsize=2)
+def _daily_pick(day: datetime.date):
+    """Direct copy of coordinator._daily_pick."""
+    day_of_year = day.timetuple().tm_yday
+    return (
+        DEVICE_QUOTES[day_of_year % len(DEVICE_QUOTES)],
+        HOUSE_MASCOTS[day_of_year % len(HOUSE_MASCOTS)],
+    )
 
 
 def _collect_fun_stats_sync(all_states, everything_off: bool):
     """Direct copy of VibeStatsCoordinator._collect_fun_stats_sync."""
-    entity_ids = [s.entity_id for s in all_states]
+    # One pass over the states: entity-ID length stats + friendly names
     all_names = []
+    total_id_len = 0
+    longest_entity_id = ""
+    shortest_entity_id = ""
+    longest_len = -1
+    shortest_len = -1
     for s in all_states:
+        eid = s.entity_id
+        eid_len = len(eid)
+        total_id_len += eid_len
+        if eid_len > longest_len:
+            longest_len, longest_entity_id = eid_len, eid
+        if shortest_len < 0 or eid_len < shortest_len:
+            shortest_len, shortest_entity_id = eid_len, eid
         name = s.attributes.get("friendly_name") or ""
         if name:
             all_names.append(name)
 
-    avg_entity_id_length = (
-        sum(len(eid) for eid in entity_ids) / len(entity_ids) if entity_ids else 0.0
-    )
-    longest_entity_id = max(entity_ids, key=len) if entity_ids else ""
-    shortest_entity_id = min(entity_ids, key=len) if entity_ids else ""
+    avg_entity_id_length = total_id_len / len(all_states) if all_states else 0.0
 
-    emoji_counts: dict[str, int] = {}
-    total_chars = 0
-    emoji_chars = 0
-    for name in all_names:
-        total_chars += len(name)
-        for match in _EMOJI_RE.finditer(name):
-            emoji_chars += len(match.group())
-            for ch in match.group():
-                emoji_counts[ch] = emoji_counts.get(ch, 0) + 1
-
-    most_used_emoji = (
-        max(emoji_counts, key=lambda e: emoji_counts[e]) if emoji_counts else "🤷"
+    all_text = "".join(all_names)
+    total_chars = len(all_text)
+    emoji_blob = (
+        ""
+        if all_text.isascii() or _EMOJI_CHARS.isdisjoint(all_text)
+        else "".join(_EMOJI_RE.findall(all_text))
     )
-    emoji_density = round(emoji_chars / total_chars * 100, 2) if total_chars > 0 else 0.0
+    emoji_chars = len(emoji_blob)
+    emoji_counts = Counter(emoji_blob)
 
-    pokemon_count = sum(
-        1 for name in all_names if any(p in name.lower() for p in POKEMON_NAMES)
-    )
+    most_used_emoji = emoji_counts.most_common(1)[0][0] if emoji_counts else "🤷"
+    emoji_density = round(emoji_chars / total_chars * 100, 2) if total_chars > 0 else 0.0
 
-    name_freq: dict[str, int] = {}
+    pokemon_count = 0
+    names_with_numbers = 0
+    name_freq = Counter()
     for name in all_names:
-        clean = name.strip().lower()
+        lower = name.lower()
+        if not POKEMON_SET.isdisjoint(_WORD_SPLIT_RE.split(lower)):
+            pokemon_count += 1
+        if (
+            _HAS_DIGIT_RE.search(name)
+            if name.isascii()
+            else any(ch.isdigit() for ch in name)
+        ):
+            names_with_numbers += 1
+        clean = lower.strip()
         if clean:
-            name_freq[clean] = name_freq.get(clean, 0) + 1
+            name_freq[clean] += 1
 
     most_redundant_name = "N/A"
     if name_freq:
-        best = max(name_freq, key=lambda n: (name_freq[n], -len(n)))
-        if name_freq[best] > 1:
-            most_redundant_name = f"{best!r} (×{name_freq[best]})"
-
-    names_with_numbers = sum(1 for name in all_names if any(ch.isdigit() for ch in name))
+        best, count = max(name_freq.items(), key=lambda kv: (kv[1], -len(kv[0])))
+        if count > 1:
+            most_redundant_name = f"{best!r} (×{count})"
 
-    day_of_year = datetime.date.today().timetuple().tm_yday
-    random_daily_quote = DEVICE_QUOTES[day_of_year % len(DEVICE_QUOTES)]
-    house_mascot = HOUSE_MASCOTS[day_of_year % len(HOUSE_MASCOTS)]
+    random_daily_quote, house_mascot = _daily_pick(datetime.date.today())
 
     return {
         "most_used_emoji": most_used_emoji,
@@ -138,6 +186,97 @@ def _collect_fun_stats_sync(all_states, everything_off: bool):
     }
 
 
+def _snapshot_signature(all_states):
+    """Mirror of the signature tracked in VibeStatsCoordinator._collect_core_stats."""
+    newest_update = None
+    for s in all_states:
+        last_updated = s.last_updated
+        if newest_update is None or last_updated > newest_update:
+            newest_update = last_updated
+    return len(all_states), newest_update
+
+
+def _make_coordinator(enable_fun_stats: bool = True) -> SimpleNamespace:
+    """Stand-in for the fun-stats cache attributes of VibeStatsCoordinator."""
+    return SimpleNamespace(
+        enable_fun_stats=enable_fun_stats,
+        _fun_signature=None,
+        _last_fun=None,
+    )
+
+
+def _update_fun(coordinator, all_states, everything_off: bool):
+    """Mirror of the fun-stats reuse branch in VibeStatsCoordinator._async_update_data."""
+    signature = _snapshot_signature(all_states)
+    rescan_fun = coordinator.enable_fun_stats and (
+        coordinator._last_fun is None or signature != coordinator._fun_signature
+    )
+    fun = {}
+    if rescan_fun:
+        fun = coordinator._last_fun = _collect_fun_stats_sync(all_states, everything_off)
+        coordinator._fun_signature = signature
+    elif coordinator.enable_fun_stats and coordinator._last_fun is not None:
+        # Daily picks roll over at midnight even on an idle system
+        quote, mascot = _daily_pick(datetime.date.today())
+        fun = {
+            **coordinator._last_fun,
+            "random_daily_quote": quote,
+            "house_mascot": mascot,
+            "everything_off": everything_off,
+        }
+    return fun
+
+
+def _cpu_busy_total(cpu_times):
+    """Direct copy of coordinator._cpu_busy_total."""
+    total = sum(cpu_times)
+    # On Linux guest time is already included in user / nice
+    total -= getattr(cpu_times, "guest", 0.0) + getattr(cpu_times, "guest_nice", 0.0)
+    idle = cpu_times.idle + getattr(cpu_times, "iowait", 0.0)
+    return total - idle, total
+
+
+def _cpu_percent(prev, cur):
+    """Direct copy of coordinator._cpu_percent."""
+    busy, total = _cpu_busy_total(cur)
+    if prev is not None:
+        prev_busy, prev_total = _cpu_busy_total(prev)
+        busy -= prev_busy
+        total -= prev_total
+    if total <= 0:
+        return None
+    return round(min(max(busy / total * 100, 0.0), 100.0), 1)
+
+
+# Subset of psutil's Linux scputimes layout
+_CpuTimes = namedtuple("_CpuTimes", "user nice system idle iowait guest guest_nice")
+
+
+# ---------------------------------------------------------------------------
+# Tests for _cpu_percent
+# ---------------------------------------------------------------------------
+
+class TestCpuPercent:
+    def test_delta_between_samples(self):
+        prev = _CpuTimes(100.0, 0.0, 50.0, 800.0, 50.0, 0.0, 0.0)
+        cur = _CpuTimes(130.0, 0.0, 60.0, 850.0, 60.0, 0.0, 0.0)
+        # busy +40 of total +100 (idle and iowait count as not busy)
+        assert _cpu_percent(prev, cur) == 40.0
+
+    def test_first_sample_is_average_since_boot(self):
+        cur = _CpuTimes(20.0, 0.0, 5.0, 75.0, 0.0, 0.0, 0.0)
+        assert _cpu_percent(None, cur) == 25.0
+
+    def test_guest_time_not_double_counted(self):
+        prev = _CpuTimes(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        cur = _CpuTimes(50.0, 0.0, 0.0, 50.0, 0.0, 20.0, 0.0)
+        assert _cpu_percent(prev, cur) == 50.0
+
+    def test_no_elapsed_time_is_unknown(self):
+        sample = _CpuTimes(10.0, 0.0, 0.0, 90.0, 0.0, 0.0, 0.0)
+        assert _cpu_percent(sample, sample) is None
+
+
 # ---------------------------------------------------------------------------
 # Tests for _aggregate_energy
 # ---------------------------------------------------------------------------
@@ -194,6 +333,30 @@ class TestAggregateEnergy:
         assert total == 3.0
         assert count == 1
 
+    def test_missing_unit_ignored(self):
+        states = [_make_state("sensor.a", "3.0", {"unit_of_measurement": None})]
+        total, count = _aggregate_energy(states)
+        assert total == 0.0
+        assert count == 0
+
+    def test_non_string_unit_ignored(self):
+        states = [
+            _make_state("sensor.a", "3", {"unit_of_measurement": 5}),
+            _make_state("sensor.b", "2.0", {"unit_of_measurement": "kWh"}),
+        ]
+        total, count = _aggregate_energy(states)
+        assert total == 2.0
+        assert count == 1
+
+    def test_non_sensor_domain_ignored(self):
+        states = [
+            _make_state("input_number.a", "7.0", {"unit_of_measurement": "kWh"}),
+            _make_state("sensor.b", "2.0", {"unit_of_measurement": "kWh"}),
+        ]
+        total, count = _aggregate_energy(states)
+        assert total == 2.0
+        assert count == 1
+
 
 # ---------------------------------------------------------------------------
 # Tests for _collect_fun_stats_sync
@@ -227,6 +390,21 @@ class TestCollectFunStats:
         result = _collect_fun_stats_sync(states, everything_off=True)
         assert result["devices_named_after_pokemon"] == 1
 
+    def test_pokemon_counted_once_per_name(self):
+        states = [
+            _make_state("sensor.a", attributes={"friendly_name": "Mewtwo & Pikachu"}),
+        ]
+        result = _collect_fun_stats_sync(states, everything_off=True)
+        assert result["devices_named_after_pokemon"] == 1
+
+    def test_pokemon_whole_word_only(self):
+        states = [
+            _make_state("sensor.a", attributes={"friendly_name": "Smew Duck Feeder"}),
+            _make_state("sensor.b", attributes={"friendly_name": "Eevee_Lamp"}),
+        ]
+        result = _collect_fun_stats_sync(states, everything_off=True)
+        assert result["devices_named_after_pokemon"] == 1
+
     def test_avg_entity_id_length(self):
         states = [_make_state("a.bc"), _make_state("a.bcde")]  # lengths 4, 6
         result = _collect_fun_stats_sync(states, everything_off=True)
@@ -238,6 +416,22 @@ class TestCollectFunStats:
         assert result["most_used_emoji"] == "💡"
         assert result["emoji_density"] > 0
 
+    def test_emoji_most_common_and_density(self):
+        states = [
+            _make_state("sensor.a", attributes={"friendly_name": "💡💡 Lamp"}),
+            _make_state("sensor.b", attributes={"friendly_name": "🔥 💡"}),
+        ]
+        result = _collect_fun_stats_sync(states, everything_off=True)
+        assert result["most_used_emoji"] == "💡"
+        # 4 emoji out of 7 + 3 characters
+        assert result["emoji_density"] == 40.0
+
+    def test_ascii_only_names_have_no_emoji(self):
+        states = [_make_state("sensor.a", attributes={"friendly_name": "Kitchen Light"})]
+        result = _collect_fun_stats_sync(states, everything_off=True)
+        assert result["most_used_emoji"] == "🤷"
+        assert result["emoji_density"] == 0.0
+
     def test_redundant_name(self):
         states = [
             _make_state("sensor.a", attributes={"friendly_name": "Bedroom"}),
@@ -248,6 +442,16 @@ class TestCollectFunStats:
         assert "'bedroom'" in result["most_redundant_name"]
         assert "×3" in result["most_redundant_name"]
 
+    def test_redundant_name_tie_prefers_shorter(self):
+        states = [
+            _make_state("sensor.a", attributes={"friendly_name": "Living Room Lamp"}),
+            _make_state("sensor.b", attributes={"friendly_name": "Hall"}),
+            _make_state("sensor.c", attributes={"friendly_name": " living room lamp "}),
+            _make_state("sensor.d", attributes={"friendly_name": "HALL"}),
+        ]
+        result = _collect_fun_stats_sync(states, everything_off=True)
+        assert result["most_redundant_name"] == "'hall' (×2)"
+
     def test_no_redundancy_when_all_unique(self):
         states = [
             _make_state("sensor.a", attributes={"friendly_name": "Kitchen"}),
@@ -265,6 +469,16 @@ class TestCollectFunStats:
         result = _collect_fun_stats_sync(states, everything_off=True)
         assert result["names_with_numbers"] == 2
 
+    def test_names_with_unicode_digits(self):
+        """Non-ASCII digits count like str.isdigit() does."""
+        states = [
+            _make_state("sensor.a", attributes={"friendly_name": "Büro ²"}),
+            _make_state("sensor.b", attributes={"friendly_name": "Lamp ①"}),
+            _make_state("sensor.c", attributes={"friendly_name": "Küche"}),
+        ]
+        result = _collect_fun_stats_sync(states, everything_off=True)
+        assert result["names_with_numbers"] == 2
+
     def test_everything_off_passed_through(self):
         assert _collect_fun_stats_sync([], everything_off=True)["everything_off"] is True
         assert _collect_fun_stats_sync([], everything_off=False)["everything_off"] is False
@@ -278,6 +492,12 @@ class TestCollectFunStats:
         assert result["longest_entity_id"] == "sensor.very_long_entity_id_name"
         assert result["shortest_entity_id"] == "a.b"
 
+    def test_longest_shortest_ties_keep_first(self):
+        states = [_make_state("a.bb"), _make_state("a.cc"), _make_state("a.dddd"), _make_state("a.eeee")]
+        result = _collect_fun_stats_sync(states, everything_off=True)
+        assert result["longest_entity_id"] == "a.dddd"
+        assert result["shortest_entity_id"] == "a.bb"
+
     def test_daily_quote_and_mascot_valid(self):
         result = _collect_fun_stats_sync([], everything_off=True)
         assert isinstance(result["random_daily_quote"], str)
@@ -293,3 +513,83 @@ class TestCollectFunStats:
         # But no name stats
         assert result["most_used_emoji"] == "🤷"
 
+    def test_daily_pick_rotates_by_day_of_year(self):
+        assert _daily_pick(datetime.date(2024, 1, 1)) == ("Quote B", "🐉 Dragon")
+        assert _daily_pick(datetime.date(2024, 1, 2)) == ("Quote C", "🦊 Fox")
+
+
+# ---------------------------------------------------------------------------
+# Tests for the fun-stats snapshot cache
+# ---------------------------------------------------------------------------
+
+_T1 = _T0 + datetime.timedelta(minutes=5)
+
+
+class TestFunStatsCache:
+    def _states(self):
+        return [
+            _make_state("light.a", attributes={"friendly_name": "Lamp"}),
+            _make_state("light.b", attributes={"friendly_name": "Lamp"}),
+            _make_state("sensor.c", attributes={"friendly_name": "Pikachu"}),
+        ]
+
+    def test_unchanged_snapshot_reuses_stats(self):
+        coordinator = _make_coordinator()
+        first = _update_fun(coordinator, self._states(), everything_off=True)
+        second = _update_fun(coordinator, self._states(), everything_off=True)
+        assert coordinator._last_fun is first
+        assert second == first
+
+    def test_rename_triggers_rescan(self):
+        coordinator = _make_coordinator()
+        _update_fun(coordinator, self._states(), everything_off=True)
+        states = self._states()
+        # A friendly-name change bumps last_updated but not last_changed
+        states[2] = _make_state(
+            "sensor.c", attributes={"friendly_name": "Lamp"}, last_updated=_T1
+        )
+        fun = _update_fun(coordinator, states, everything_off=True)
+        assert fun["devices_named_after_pokemon"] == 0
+        assert coordinator._fun_signature == (3, _T1)
+
+    def test_removal_triggers_rescan(self):
+        coordinator = _make_coordinator()
+        _update_fun(coordinator, self._states(), everything_off=True)
+        fun = _update_fun(coordinator, self._states()[:2], everything_off=True)
+        assert fun["devices_named_after_pokemon"] == 0
+        assert coordinator._fun_signature == (2, _T0)
+
+    def test_attribute_change_triggers_rescan(self):
+        coordinator = _make_coordinator()
+        first = _update_fun(coordinator, self._states(), everything_off=True)
+        states = self._states()
+        states[0] = _make_state(
+            "light.a",
+            attributes={"friendly_name": "Lamp", "brightness": 80},
+            last_updated=_T1,
+        )
+        _update_fun(coordinator, states, everything_off=True)
+        assert coordinator._last_fun is not first
+        assert coordinator._fun_signature == (3, _T1)
+
+    def test_cached_path_refreshes_daily_picks_and_party_mode(self):
+        coordinator = _make_coordinator()
+        _update_fun(coordinator, self._states(), everything_off=True)
+        coordinator._last_fun = {
+            **coordinator._last_fun,
+            "random_daily_quote": "stale",
+            "house_mascot": "stale",
+        }
+        cached = coordinator._last_fun
+        fun = _update_fun(coordinator, self._states(), everything_off=False)
+        assert coordinator._last_fun is cached
+        assert (fun["random_daily_quote"], fun["house_mascot"]) == _daily_pick(
+            datetime.date.today()
+        )
+        assert fun["everything_off"] is False
+        assert fun["most_redundant_name"] == cached["most_redundant_name"]
+
+    def test_disabled_returns_empty(self):
+        coordinator = _make_coordinator(enable_fun_stats=False)
+        assert _update_fun(coordinator, self._states(), everything_off=True) == {}
+        assert coordinator._last_fun is None